@@ -0,0 +1,137 @@
+"""
+Bitrate chart widget for the ProRes Bitrate Analyzer.
+Kept apart from prores_analyser.py so pyqtgraph is only imported by the
+main window, after the splash screen is up, and never by batch workers.
+"""
+
+import logging
+from pathlib import Path
+from PyQt6.QtCore import QMarginsF, QPointF, QRectF
+from PyQt6.QtGui import QColor, QPainter, QPageSize, QPdfWriter
+from PyQt6.QtSvg import QSvgGenerator
+import numpy as np
+import pyqtgraph as pg
+import pyqtgraph.exporters
+
+
+logger = logging.getLogger(__name__)
+
+
+def minmax_envelope(times, values, buckets):
+    """
+    Reduce a series to (start times, mins, maxes) of `buckets` equal slices.
+    """
+    edges = np.linspace(0, len(values), buckets + 1, dtype=np.intp)[:-1]
+    lows = np.minimum.reduceat(values, edges)
+    highs = np.maximum.reduceat(values, edges)
+    return times[edges], lows, highs
+
+
+def minmax_decimate(times, values, buckets):
+    """
+    Reduce a series to the min and max of each of `buckets` equal slices,
+    interleaved so a single line still traces the full envelope.
+    """
+    starts, lows, highs = minmax_envelope(times, values, buckets)
+    return np.repeat(starts, 2), np.column_stack((lows, highs)).ravel()
+
+
+class BitrateChart(pg.PlotWidget):
+    """
+    Per-frame bitrate with its rolling average.
+    NEW in v1.3.0: Drawn by pyqtgraph through Qt's own QPainter path, so
+    updates and resizes need no figure re-layout or off-screen render.
+    """
+    # Long series are decimated to one min/max pair per pixel column (but
+    # at least this many pairs); anything denser is pure overdraw
+    MIN_PLOT_BUCKETS = 1000
+    
+    def __init__(self, parent=None, window_seconds=1.0):
+        super().__init__(parent, background='#2b2b2b')
+        self.setMinimumSize(400, 300)
+        self.setup_plot()
+        
+        # Created once and updated with setData on every plot
+        self._frame_curve = self.plot([], [], name='Per-frame',
+                                      pen=pg.mkPen(QColor(79, 195, 247, 77), width=1))
+        self._window_curve = self.plot([], [], name=f'{window_seconds:g}s average',
+                                       pen=pg.mkPen('#00e676', width=2),
+                                       fillLevel=0, brush=QColor(0, 230, 118, 77))
+        # Stands in for the per-frame line once it has been decimated: the
+        # band between each bucket's min and max, edges left unstroked
+        self._frame_low = self.plot([], [], pen=pg.mkPen(None))
+        self._frame_high = self.plot([], [], pen=pg.mkPen(None))
+        self._frame_envelope = pg.FillBetweenItem(self._frame_low, self._frame_high,
+                                                  brush=QColor(79, 195, 247, 77))
+        self.addItem(self._frame_envelope)
+        # Hidden until there is something to plot
+        self._legend.setVisible(False)
+        
+    def setup_plot(self):
+        plot_item = self.getPlotItem()
+        plot_item.getViewBox().setBackgroundColor('#1e1e1e')
+        for name in ('left', 'bottom'):
+            axis = plot_item.getAxis(name)
+            axis.setPen('w')
+            axis.setTextPen('w')
+        plot_item.setLabel('bottom', 'Time (seconds)', color='white', size='10pt')
+        plot_item.setLabel('left', 'Bitrate (Mbps)', color='white', size='10pt')
+        plot_item.showGrid(x=True, y=True, alpha=0.2)
+        self._legend = plot_item.addLegend(offset=(-10, 10), brush='#2b2b2b',
+                                           pen='w', labelTextColor='w')
+        
+    def plot_bitrate(self, times, bitrates, windowed_times, windowed_bitrates):
+        logger.debug("Plotting %d frames, %d windowed points", len(times), len(windowed_times))
+        
+        # The windowed series is a rolling mean, so it is as long as the per-frame data
+        buckets = max(self.MIN_PLOT_BUCKETS,
+                      int(self.width() * self.devicePixelRatioF()))
+        if len(times) > 2 * buckets:
+            # Long per-frame series are drawn as a filled min/max band
+            # rather than a zigzag line; the line itself is emptied so its
+            # legend entry stays as it is
+            starts, lows, highs = minmax_envelope(times, bitrates, buckets)
+            self._frame_low.setData(starts, lows)
+            self._frame_high.setData(starts, highs)
+            self._frame_curve.setData([], [])
+        else:
+            self._frame_low.setData([], [])
+            self._frame_high.setData([], [])
+            self._frame_curve.setData(times, bitrates)
+        if len(windowed_times) > 2 * buckets:
+            windowed_times, windowed_bitrates = minmax_decimate(
+                windowed_times, windowed_bitrates, buckets)
+        
+        self._window_curve.setData(windowed_times, windowed_bitrates)
+        
+        plot_item = self.getPlotItem()
+        plot_item.setTitle('Bitrate Over Time', color='white', size='12pt', bold=True)
+        plot_item.enableAutoRange()
+        self._legend.setVisible(True)
+    
+    def export(self, filepath):
+        """Save the chart as PNG (at 3x screen resolution), SVG or PDF."""
+        plot_item = self.getPlotItem()
+        source = plot_item.sceneBoundingRect()
+        suffix = Path(filepath).suffix.lower()
+        if suffix == '.svg':
+            device = QSvgGenerator()
+            device.setFileName(filepath)
+            device.setSize(source.size().toSize())
+            device.setViewBox(QRectF(QPointF(0, 0), source.size()))
+        elif suffix == '.pdf':
+            device = QPdfWriter(filepath)
+            device.setPageSize(QPageSize(source.size(), QPageSize.Unit.Point))
+            device.setPageMargins(QMarginsF(0, 0, 0, 0))
+        else:
+            exporter = pg.exporters.ImageExporter(plot_item)
+            exporter.parameters()['width'] = int(source.width() * 3)
+            exporter.export(filepath)
+            return
+        
+        # Vector formats: paint the scene straight onto the output device
+        painter = QPainter(device)
+        target = QRectF(painter.viewport())
+        painter.fillRect(target, QColor('#2b2b2b'))
+        self.scene().render(painter, target, source)
+        painter.end()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Compile the statistics and packet parsing kernels ahead of time into
+the _prores_kernels extension module.
+
+prores_analyser.py imports _prores_kernels when it exists, so the app
+never pays Numba's first-call JIT compile. Without it the kernels are
+JIT-compiled on first use (or NumPy is used if Numba is missing).
+Unlike the JIT kernels, these exports hold the GIL while they run.
+
+Usage (from the project directory, inside the venv):
+    python build_kernels.py
+"""
+
+from numba.pycc import CC
+
+from prores_analyser import packet_kernel, stats_kernel
+
+
+cc = CC('_prores_kernels')
+cc.verbose = True
+
+# sizes, fps, window, bitrates (out), windowed (out), moments (out)
+cc.export('compute_stats', 'void(i4[:], f8, i8, f4[:], f4[:], f8[:])')(stats_kernel)
+
+# buf, times (out), sizes (out), types (out) -> rows parsed
+cc.export('parse_packets', 'i8(u1[:], f4[:], i4[:], u1[:])')(packet_kernel)
+
+
+if __name__ == '__main__':
+    cc.compile()
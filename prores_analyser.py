@@ -5,26 +5,76 @@ Performance improvements and new features
 """
 
 import sys
+import multiprocessing
+import csv
+import functools
+import hashlib
+import itertools
 import json
+import logging
+import os
+import shutil
 import subprocess
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QPushButton, QLabel, QFileDialog, 
-                            QProgressBar, QTextEdit, QSplitter, QGroupBox, QSplashScreen)
+                            QProgressBar, QTextEdit, QSplitter, QGroupBox, QSplashScreen,
+                            QMessageBox)
 from PyQt6.QtCore import QThread, pyqtSignal, Qt, QSettings
 from PyQt6.QtGui import QFont, QPalette, QColor, QPixmap, QPainter, QAction, QKeySequence
-import matplotlib
-matplotlib.use('QtAgg')
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, exports fall back to the json module
+    orjson = None
 
-def create_splash_screen():
-    """
-    Create a splash screen shown during app startup.
-    NEW in v1.2.0: Provides visual feedback during 8-second load time.
-    """
+
+logger = logging.getLogger(__name__)
+
+VIDEO_EXTENSIONS = ('.mov', '.mp4', '.mxf')
+
+# Probe results are cached here so re-opening a file skips ffprobe.
+# Bump CACHE_VERSION whenever the layout of FrameData or the metadata changes.
+CACHE_DIR = Path.home() / '.cache' / 'prores-analyser'
+CACHE_VERSION = 5
+
+# Pre-rendered splash artwork. Bump SPLASH_VERSION whenever
+# render_splash_pixmap changes, so existing installs render it afresh.
+SPLASH_VERSION = 1
+SPLASH_CACHE = CACHE_DIR / f'splash-{SPLASH_VERSION}.png'
+
+# One record per video packet as parsed from ffprobe's CSV output by the
+# NumPy fallback. Sizes are read as float so an N/A can become NaN (then 0);
+# they are stored as int32 like everywhere else.
+PACKET_DTYPE = [('time', 'f4'), ('size', 'f8'), ('flags', 'U3')]
+
+# Packet rows parsed per chunk; bounds the text held in memory at once
+PARSE_CHUNK_ROWS = 65536
+# The first chunk is smaller and each one after doubles up to the cap
+# above, so progress starts moving straight away on short files too
+FIRST_CHUNK_ROWS = 1024
+
+# Status line colours
+STATUS_OK_STYLE = "color: #00e676;"
+STATUS_ERROR_STYLE = "color: #ff5252;"
+
+# Length of the rolling average drawn over the per-frame bitrate
+ROLLING_WINDOW_SECONDS = 1.0
+
+# Frame type codes in FrameData.types (uint8): keyframe or not
+TYPE_P = 0
+TYPE_I = 1
+
+# Per-frame data stored column-wise: each field is its own contiguous array
+FrameData = namedtuple('FrameData', ['times', 'sizes', 'types'])
+
+
+def render_splash_pixmap():
+    """Draw the static splash artwork: everything except the version label."""
     # Create a 600x400 splash image
     splash_pix = QPixmap(600, 400)
     splash_pix.fill(QColor(30, 30, 30))  # Dark background
@@ -39,12 +89,6 @@ def create_splash_screen():
     painter.drawText(splash_pix.rect(), Qt.AlignmentFlag.AlignCenter, 
                     "ProRes Bitrate Analyser")
     
-    # Version
-    painter.setPen(QColor(0, 230, 118))
-    version_font = QFont("Arial", 16)
-    painter.setFont(version_font)
-    painter.drawText(50, 250, "v1.2.0")
-    
     # Loading message
     painter.setPen(QColor(200, 200, 200))
     loading_font = QFont("Arial", 14)
@@ -62,6 +106,33 @@ def create_splash_screen():
                     "Analyze video bitrate over time")
     
     painter.end()
+    return splash_pix
+
+
+def create_splash_screen():
+    """
+    Create a splash screen shown during app startup.
+    NEW in v1.2.0: Provides visual feedback during 8-second load time.
+    NEW in v1.3.0: The static artwork is rendered once and cached as a PNG;
+    later launches just load it and draw the version label on top.
+    """
+    splash_pix = QPixmap(str(SPLASH_CACHE))
+    if splash_pix.isNull():
+        splash_pix = render_splash_pixmap()
+        try:
+            SPLASH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            if not splash_pix.save(str(SPLASH_CACHE), 'PNG'):
+                raise OSError(f"could not write {SPLASH_CACHE}")
+        except OSError as e:
+            logger.warning("Could not cache splash image: %s", e)
+    
+    # Version
+    painter = QPainter(splash_pix)
+    painter.setPen(QColor(0, 230, 118))
+    version_font = QFont("Arial", 16)
+    painter.setFont(version_font)
+    painter.drawText(50, 250, "v1.2.0")
+    painter.end()
     
     # Create splash screen widget
     splash = QSplashScreen(splash_pix, Qt.WindowType.WindowStaysOnTopHint)
@@ -71,29 +142,278 @@ def create_splash_screen():
     return splash
 
 
+def stats_kernel(sizes, fps, window, bitrates, windowed, moments):
+    """
+    Single-pass bitrate kernel: per-frame bitrates, rolling window mean
+    (running sum, O(N)) and mean/max/min/std accumulated in the same loop,
+    the std via Welford's update (stable, unlike a raw sum of squares).
+    Results are written into the preallocated output arrays, with
+    moments = [mean, max, min, std], so the same plain-loop source can be
+    JIT-compiled by Numba or exported ahead of time by build_kernels.py.
+    The bitrate series are float32; all accumulation is done in float64.
+    """
+    n = sizes.shape[0]
+    scale = 8.0 * fps / 1_000_000
+    
+    running = 0.0
+    mean = 0.0
+    m2 = 0.0
+    max_br = sizes[0] * scale
+    min_br = max_br
+    for i in range(n):
+        br = sizes[i] * scale
+        bitrates[i] = br
+        delta = br - mean
+        mean += delta / (i + 1)
+        m2 += delta * (br - mean)
+        if br > max_br:
+            max_br = br
+        if br < min_br:
+            min_br = br
+        
+        # Add the stored (float32) value so it cancels exactly when it
+        # leaves the window
+        running += bitrates[i]
+        if i >= window:
+            running -= bitrates[i - window]
+        if i >= window - 1:
+            windowed[i - window + 1] = running / window
+    
+    moments[0] = mean
+    moments[1] = max_br
+    moments[2] = min_br
+    moments[3] = np.sqrt(m2 / n)
+
+
+def packet_kernel(buf, times, sizes, types):
+    """
+    Parse a block of 'pts_time,size,flags' CSV rows held as raw bytes.
+    Walks the buffer once, converting each field in place, and writes
+    into the preallocated column arrays; types gets TYPE_I for
+    keyframes and TYPE_P otherwise. N/A times become NaN and N/A sizes
+    0. Returns the number of rows parsed.
+    """
+    n = buf.shape[0]
+    pos = 0
+    row = 0
+    while pos < n and row < times.shape[0]:
+        # pts_time
+        if buf[pos] == 78:  # 'N' of N/A
+            t = np.nan
+        else:
+            negative = buf[pos] == 45  # '-'
+            if negative:
+                pos += 1
+            t = 0.0
+            while pos < n and 48 <= buf[pos] <= 57:
+                t = t * 10.0 + (buf[pos] - 48)
+                pos += 1
+            if pos < n and buf[pos] == 46:  # '.'
+                pos += 1
+                scale = 0.1
+                while pos < n and 48 <= buf[pos] <= 57:
+                    t += (buf[pos] - 48) * scale
+                    scale *= 0.1
+                    pos += 1
+            if negative:
+                t = -t
+        while pos < n and buf[pos] != 44:  # ','
+            pos += 1
+        pos += 1
+        
+        # size
+        size = 0
+        while pos < n and 48 <= buf[pos] <= 57:
+            size = size * 10 + (buf[pos] - 48)
+            pos += 1
+        while pos < n and buf[pos] != 44:
+            pos += 1
+        pos += 1
+        
+        # flags: a K marks a keyframe
+        types[row] = TYPE_I if pos < n and buf[pos] == 75 else TYPE_P
+        while pos < n and buf[pos] != 10:  # end of row
+            pos += 1
+        pos += 1
+        
+        times[row] = t
+        sizes[row] = size
+        row += 1
+    return row
+
+
+_compiled_kernels = None
+
+
+def _get_kernels():
+    """
+    Return the compiled (stats, packet) kernels, or Nones without Numba.
+    Loaded on first use rather than at import, so startup and the splash
+    screen never wait on Numba. Prefers the ahead-of-time build (no
+    first-call compile), then Numba's JIT.
+    Only the JIT kernels release the GIL: numba.pycc exports hold it for
+    the whole call. With the AOT build the UI thread still gets a turn
+    between packet chunks, but not during one stats_kernel call, which
+    only matters for very long files.
+    """
+    global _compiled_kernels
+    if _compiled_kernels is None:
+        try:
+            from _prores_kernels import compute_stats, parse_packets
+            _compiled_kernels = (compute_stats, parse_packets)
+        except ImportError:
+            try:
+                from numba import njit
+            except ImportError:  # Numba is optional, fall back to plain NumPy
+                _compiled_kernels = (None, None)
+            else:
+                # nogil: the kernels run on worker threads, and releasing
+                # the GIL keeps the UI thread responsive. A frozen app has
+                # no source file for Numba to key its on-disk cache on
+                cache = not getattr(sys, 'frozen', False)
+                _compiled_kernels = (njit(cache=cache, fastmath=True, nogil=True)(stats_kernel),
+                                     njit(cache=cache, nogil=True)(packet_kernel))
+    return _compiled_kernels
+
+
+def rolling_mean(values, window):
+    """
+    Mean of every run of `window` consecutive values (numpy 'valid' mode),
+    in O(N) for any window size; returned as float32.
+    """
+    # Rolling mean as a difference of prefix sums: O(N) instead of O(N*W)
+    c = np.empty(len(values) + 1, np.float64)
+    c[0] = 0.0
+    np.cumsum(values, out=c[1:])
+    return ((c[window:] - c[:-window]) * (1.0 / window)).astype(np.float32)
+
+
+def _compute_stats_numpy(sizes, fps, window):
+    """NumPy equivalent of stats_kernel, used when Numba is missing."""
+    bitrates = sizes.astype(np.float32) * np.float32(8 * fps / 1_000_000)
+    windowed = rolling_mean(bitrates, window)
+    return (bitrates, windowed, float(np.mean(bitrates, dtype=np.float64)),
+            float(np.max(bitrates)), float(np.min(bitrates)),
+            float(np.std(bitrates, dtype=np.float64)))
+
+
+def _compute_stats(sizes, fps, window):
+    """Return (bitrates, windowed, mean, max, min, std) for a sizes array."""
+    compiled_stats_kernel = _get_kernels()[0]
+    if compiled_stats_kernel is None:
+        return _compute_stats_numpy(sizes, fps, window)
+    
+    n = len(sizes)
+    # float32 series halve the memory traffic of every later pass (plotting,
+    # decimation, export); bitrates fit easily in float32's 24-bit mantissa
+    bitrates = np.empty(n, np.float32)
+    windowed = np.empty(max(n - window + 1, 0), np.float32)
+    moments = np.empty(4, np.float64)
+    compiled_stats_kernel(np.ascontiguousarray(sizes, np.int32), float(fps),
+                          int(window), bitrates, windowed, moments)
+    return (bitrates, windowed, *moments.tolist())
+
+
+def _cache_path(filepath):
+    """Cache file for a video, keyed on its path, mtime and size."""
+    st = os.stat(filepath)
+    key = f"{CACHE_VERSION}:{os.path.abspath(filepath)}:{st.st_mtime_ns}:{st.st_size}"
+    return CACHE_DIR / f"{hashlib.blake2b(key.encode(), digest_size=20).hexdigest()}.npz"
+
+
+def load_cached_probe(filepath):
+    """
+    Return (metadata, frame_data) from a previous probe of this exact file,
+    or None. A changed mtime or size gives a different key, so stale
+    entries are simply never looked up again. An unreadable entry is
+    deleted, so the re-probe that follows can replace it.
+    """
+    try:
+        path = _cache_path(filepath)
+    except OSError:
+        return None
+    try:
+        with np.load(path) as cached:
+            metadata = json.loads(str(cached['metadata']))
+            frame_data = FrameData(*(cached[name] for name in FrameData._fields))
+        return metadata, frame_data
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile) as e:
+        logger.warning("Discarding unreadable analysis cache %s: %s", path.name, e)
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+
+
+def save_cached_probe(filepath, metadata, frame_data):
+    """Store a probe result for load_cached_probe; failures are ignored."""
+    try:
+        path = _cache_path(filepath)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, metadata=json.dumps(metadata), **frame_data._asdict())
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.warning("Could not write analysis cache: %s", e)
+
+
+def _grown(arr, filled, capacity):
+    """Copy the first `filled` items of arr into a new array of `capacity`."""
+    grown = np.empty(capacity, arr.dtype)
+    grown[:filled] = arr[:filled]
+    return grown
+
+
+@functools.lru_cache(maxsize=None)
+def find_ffprobe():
+    """
+    Absolute path of ffprobe, or None. Looked up once per process; a copy
+    bundled next to the frozen app is preferred over one on PATH.
+    """
+    bundle_dir = getattr(sys, '_MEIPASS', None)
+    if bundle_dir is not None:
+        bundled = shutil.which('ffprobe', path=bundle_dir)
+        if bundled is not None:
+            return bundled
+    return shutil.which('ffprobe')
+
+
 class VideoAnalyzer(QThread):
     progress = pyqtSignal(int, str)
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
     
-    def __init__(self, filepath):
+    def __init__(self, filepath, ffprobe_path):
         super().__init__()
         self.filepath = filepath
+        self.ffprobe_path = ffprobe_path
         
     def run(self):
         try:
-            self.progress.emit(10, "Checking FFprobe availability...")
-            try:
-                subprocess.run(['ffprobe', '-version'], capture_output=True, check=True)
-            except:
-                self.error.emit("FFprobe not found. Install with: brew install ffmpeg")
-                return
-            
-            self.progress.emit(20, "Extracting video metadata...")
-            metadata = self._get_video_metadata()
-            
-            self.progress.emit(40, "Analyzing frame data...")
-            frame_data = self._get_frame_data(metadata['fps'])
+            cached = load_cached_probe(self.filepath)
+            if cached is not None:
+                self.progress.emit(40, "Loading cached frame data...")
+                metadata, frame_data = cached
+            else:
+                if self.ffprobe_path is None:
+                    self.error.emit("FFprobe not found. Install with: brew install ffmpeg")
+                    return
+                
+                self.progress.emit(20, "Analyzing video and frame data...")
+                metadata, frame_data = self._probe(
+                    self.filepath, self.ffprobe_path,
+                    lambda fraction, frames, expected: self.progress.emit(
+                        20 + int(50 * fraction),
+                        f"Reading frame data... {frames}/{expected} frames"))
             
             self.progress.emit(70, "Calculating statistics...")
             stats = self._calculate_statistics(frame_data, metadata)
@@ -104,85 +424,195 @@ class VideoAnalyzer(QThread):
             self.progress.emit(100, "Analysis complete!")
             self.finished.emit(results)
             
+            # Written after the results are out, so the UI can draw them
+            # while the cache file goes to disk
+            if cached is None:
+                save_cached_probe(self.filepath, metadata, frame_data)
+            
         except Exception as e:
             self.error.emit(f"Analysis error: {str(e)}")
     
-    def _get_video_metadata(self):
-        cmd = ['ffprobe', '-v', 'quiet', '-print_format', 'json', 
-               '-show_format', '-show_streams', self.filepath]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        data = json.loads(result.stdout)
-        video_stream = next(s for s in data['streams'] if s['codec_type'] == 'video')
-        fps_parts = video_stream.get('r_frame_rate', '24/1').split('/')
-        fps = float(fps_parts[0]) / float(fps_parts[1])
-        return {
-            'codec': video_stream.get('codec_name', 'Unknown'),
-            'codec_long': video_stream.get('codec_long_name', 'Unknown'),
-            'width': video_stream.get('width', 0),
-            'height': video_stream.get('height', 0),
-            'fps': fps,
-            'duration': float(data['format'].get('duration', 0)),
-            'size': int(data['format'].get('size', 0)),
-            'bitrate': int(data['format'].get('bit_rate', 0))
-        }
+    @staticmethod
+    def _probe(filepath, ffprobe_path='ffprobe', progress=None):
+        """
+        Read stream metadata and per-frame data with a single ffprobe run.
+        NEW in v1.3.0: One process and one container parse instead of two.
+        Frame sizes come from packets, which ffprobe reads from the
+        container without decoding anything. Output is CSV with each row
+        prefixed by its section name; packet rows come first. Rows are
+        parsed as ffprobe produces them, reporting to progress as they go.
+        """
+        cmd = [ffprobe_path, '-v', 'quiet', '-threads', '0', '-select_streams', 'v:0',
+               '-show_entries',
+               'stream=codec_name,codec_long_name,width,height,r_frame_rate,avg_frame_rate:'
+               'format=duration,size,bit_rate:'
+               'packet=pts_time,size,flags',
+               '-print_format', 'csv', filepath]
+        sections = {}
+        
+        def packet_rows(lines):
+            for line in lines:
+                section, _, row = line.partition(b',')
+                if section == b'packet':
+                    yield row
+                else:
+                    sections[section.decode()] = row.decode()
+        
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              bufsize=1 << 20) as proc:
+            times, sizes, types = VideoAnalyzer._parse_packets(
+                packet_rows(proc.stdout), os.path.getsize(filepath), progress)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        if 'stream' not in sections:
+            raise ValueError("No video stream found")
+        
+        metadata = VideoAnalyzer._parse_metadata(
+            next(csv.reader([sections['stream']])),
+            next(csv.reader([sections.get('format', '')])))
+        
+        # Internal to the probe; kept out of the cached and exported metadata
+        if metadata.pop('constant_frame_rate') and np.all(types == TYPE_I):
+            # Intra-only at a constant rate (i.e. ProRes): decode order is
+            # presentation order and frame i is at exactly start + i/fps,
+            # so the timestamps are regenerated rather than patched up
+            times = VideoAnalyzer._cfr_times(times, metadata['fps'])
+        else:
+            # Packets without a usable timestamp fall back to their frame index
+            missing = np.isnan(times)
+            if missing.any():
+                times[missing] = np.flatnonzero(missing) / metadata['fps']
+            
+            # Packets arrive in decode order; restore presentation order for
+            # codecs with B-frames
+            if np.any(times[1:] < times[:-1]):
+                order = np.argsort(times, kind='stable')
+                times, sizes, types = times[order], sizes[order], types[order]
+        frame_data = FrameData(times, sizes, types)
+        
+        if len(times) > 0:
+            logger.debug("Extracted %d frames, time range: %.2fs - %.2fs",
+                         len(times), times[0], times[-1])
+        
+        return metadata, frame_data
     
-    def _get_frame_data(self, fps):
-        cmd = ['ffprobe', '-v', 'quiet', '-select_streams', 'v:0',
-               '-show_entries', 'frame=pkt_pts_time,pkt_size,pict_type',
-               '-print_format', 'json', self.filepath]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        data = json.loads(result.stdout)
-        
-        frames = []
-        frame_num = 0
-        for frame in data.get('frames', []):
-            time_val = frame.get('pkt_pts_time')
-            if time_val is None or time_val == '' or time_val == '0':
-                time_val = frame_num / fps
+    @staticmethod
+    def _cfr_times(times, fps):
+        """Evenly spaced timestamps at fps, anchored on the first valid pts."""
+        valid = np.flatnonzero(~np.isnan(times[:PARSE_CHUNK_ROWS]))
+        start = float(times[valid[0]]) - valid[0] / fps if len(valid) else 0.0
+        return (start + np.arange(len(times)) / fps).astype(np.float32)
+    
+    @staticmethod
+    def _parse_packets(rows, size_hint=0, progress=None):
+        """
+        Parse packet CSV rows into (times, sizes, types) column arrays.
+        Rows are parsed in fixed-size chunks, so only one chunk of text is
+        held at a time however long the video is. With Numba each chunk
+        goes through packet_kernel as raw bytes; otherwise np.loadtxt.
+        The columns are preallocated: after the first chunk the total
+        packet count is estimated from size_hint (the file size in bytes)
+        and the mean packet size so far, and chunks are parsed straight
+        into the arrays, which grow by half if the estimate falls short.
+        progress, if given, is called after each chunk with the fraction
+        of size_hint covered by the packets read so far, the number of
+        packets read and the estimated total.
+        NEW in v1.3.0: Chunks start at FIRST_CHUNK_ROWS and double, so
+        progress is reported early and often.
+        """
+        times = np.empty(0, np.float32)
+        sizes = np.empty(0, np.int32)
+        types = np.empty(0, np.uint8)
+        filled = 0
+        bytes_read = 0
+        chunk_rows = FIRST_CHUNK_ROWS
+        packet_kernel_fn = _get_kernels()[1]
+        while True:
+            block = list(itertools.islice(rows, chunk_rows))
+            if not block:
+                break
+            chunk_rows = min(chunk_rows * 2, PARSE_CHUNK_ROWS)
+            if filled + len(block) > len(times):
+                capacity = max(filled + len(block), len(times) * 3 // 2)
+                if filled and size_hint:
+                    mean_size = max(sizes[:filled].mean(), 1)
+                    capacity = max(capacity, int(size_hint / mean_size * 1.1))
+                times, sizes, types = (_grown(a, filled, capacity)
+                                       for a in (times, sizes, types))
+            
+            end = filled + len(block)
+            if packet_kernel_fn is not None:
+                end = filled + packet_kernel_fn(np.frombuffer(b''.join(block), np.uint8),
+                                                times[filled:end], sizes[filled:end],
+                                                types[filled:end])
             else:
-                try:
-                    time_val = float(time_val)
-                except:
-                    time_val = frame_num / fps
+                # loadtxt's C parser is several times faster than genfromtxt
+                # but has no missing-value handling, so spell N/A as nan
+                text = b''.join(block).replace(b'N/A', b'nan').decode('ascii')
+                chunk = np.loadtxt(text.splitlines(), delimiter=',',
+                                   dtype=PACKET_DTYPE, ndmin=1)
+                end = filled + len(chunk)
+                times[filled:end] = chunk['time']
+                sizes[filled:end] = np.nan_to_num(chunk['size'])
+                # A K in the packet flags marks a keyframe, which is what
+                # pict_type 'I' was used for; every ProRes packet is one
+                types[filled:end] = np.where(chunk['flags'].astype('U1') == 'K',
+                                             TYPE_I, TYPE_P)
             
-            frames.append({
-                'time': time_val,
-                'size': int(frame.get('pkt_size', 0)),
-                'type': frame.get('pict_type', 'P')
-            })
-            frame_num += 1
-        
-        if len(frames) > 0:
-            print(f"DEBUG: Extracted {len(frames)} frames, "
-                  f"time range: {frames[0]['time']:.2f}s - {frames[-1]['time']:.2f}s")
+            if progress is not None and size_hint:
+                bytes_read += int(sizes[filled:end].sum(dtype=np.int64))
+                expected = max(int(size_hint * end / max(bytes_read, 1)), end)
+                progress(min(bytes_read / size_hint, 1.0), end, expected)
+            filled = end
+        if filled < len(times):
+            # The capacity came from an estimate that can be far too high
+            # (audio tracks count towards the file size), so copy rather
+            # than return views that keep the whole buffers alive
+            return times[:filled].copy(), sizes[:filled].copy(), types[:filled].copy()
+        return times, sizes, types
+    
+    @staticmethod
+    def _parse_metadata(stream, fmt):
+        """Build the metadata dict from the stream and format CSV rows."""
+        def number(row, index, cast):
+            try:
+                return cast(row[index])
+            except (IndexError, ValueError):
+                return 0  # missing or N/A
         
-        return frames
+        fps_parts = (stream[4] if len(stream) > 4 else '24/1').split('/')
+        fps = float(fps_parts[0]) / float(fps_parts[1])
+        # The nominal rate equals the average one only for constant frame rate
+        constant = len(stream) > 5 and stream[5] == stream[4]
+        return {
+            'codec': stream[0] or 'Unknown',
+            'codec_long': stream[1] if len(stream) > 1 else 'Unknown',
+            'width': number(stream, 2, int),
+            'height': number(stream, 3, int),
+            'fps': fps,
+            'constant_frame_rate': constant,
+            'duration': number(fmt, 0, float),
+            'size': number(fmt, 1, int),
+            'bitrate': number(fmt, 2, int)
+        }
     
-    def _calculate_statistics(self, frame_data, metadata):
+    @staticmethod
+    def _calculate_statistics(frame_data, metadata):
         """
-        Calculate bitrate statistics using optimised NumPy operations.
-        NEW in v1.1.0: Much faster windowing with NumPy convolution.
+        Calculate bitrate statistics.
+        NEW in v1.3.0: Bitrates, windowing and summary stats come from a
+        single fused pass (Numba-compiled when available).
         """
-        if not frame_data:
+        times, sizes, frame_types = frame_data
+        if len(times) == 0:
             return {}
         
-        # IMPROVEMENT 1: Use list comprehensions (Pythonic and faster)
-        times = np.array([f['time'] for f in frame_data])
-        sizes = np.array([f['size'] for f in frame_data])
-        frame_types = [f['type'] for f in frame_data]
+        fps = metadata['fps']
+        window_frames = max(int(round(fps * ROLLING_WINDOW_SECONDS)), 1)
+        (bitrates, windowed_bitrates, avg_bitrate, max_bitrate,
+         min_bitrate, std_bitrate) = _compute_stats(sizes, fps, window_frames)
         
-        # Calculate bitrates using NumPy (vectorized operation)
-        bitrates = (sizes * 8 * metadata['fps']) / 1_000_000
-        
-        # IMPROVEMENT 2: Use NumPy convolution for windowing (50x faster!)
-        window_frames = int(metadata['fps'])  # 1 second worth of frames
         if len(bitrates) > window_frames:
-            # Rolling average using convolution
-            windowed_bitrates = np.convolve(
-                bitrates,
-                np.ones(window_frames) / window_frames,
-                mode='valid'
-            )
             # Align times with windowed data
             offset = window_frames // 2
             windowed_times = times[offset:offset + len(windowed_bitrates)]
@@ -191,71 +621,131 @@ class VideoAnalyzer(QThread):
             windowed_bitrates = bitrates
             windowed_times = times
         
-        print(f"DEBUG: Windowing from {times[0]:.2f}s to {times[-1]:.2f}s")
-        print(f"DEBUG: Created {len(windowed_bitrates)} windowed points")
+        logger.debug("Windowing from %.2fs to %.2fs, %d windowed points",
+                     times[0], times[-1], len(windowed_bitrates))
         
         return {
-            'avg_bitrate': np.mean(bitrates),
-            'max_bitrate': np.max(bitrates),
-            'min_bitrate': np.min(bitrates),
-            'std_bitrate': np.std(bitrates),
-            'frame_count': len(frame_data),
-            'i_frame_count': sum(1 for f in frame_types if f == 'I'),
-            'bitrates': bitrates.tolist(),
-            'times': times.tolist(),
-            'windowed_bitrates': windowed_bitrates.tolist(),
-            'windowed_times': windowed_times.tolist(),
+            'avg_bitrate': avg_bitrate,
+            'max_bitrate': max_bitrate,
+            'min_bitrate': min_bitrate,
+            'std_bitrate': std_bitrate,
+            'frame_count': len(times),
+            'i_frame_count': int(np.count_nonzero(frame_types == TYPE_I)),
+            # Kept as ndarrays; lists are only built at the export boundary
+            'bitrates': bitrates,
+            'times': times,
+            'windowed_bitrates': windowed_bitrates,
+            'windowed_times': windowed_times,
             'frame_types': frame_types
         }
 
 
-class BitrateChart(FigureCanvas):
-    def __init__(self, parent=None):
-        self.fig = Figure(figsize=(10, 6), facecolor='#2b2b2b', dpi=100)
-        super().__init__(self.fig)
-        self.setParent(parent)
-        self.setMinimumSize(400, 300)
-        self.ax = self.fig.add_subplot(111)
-        self.setup_plot()
-        self.fig.tight_layout()
-        self.draw()
-        
-    def setup_plot(self):
-        self.ax.set_facecolor('#1e1e1e')
-        self.ax.tick_params(colors='white')
-        for spine in self.ax.spines.values():
-            spine.set_color('white')
-        self.ax.set_xlabel('Time (seconds)', color='white', fontsize=10)
-        self.ax.set_ylabel('Bitrate (Mbps)', color='white', fontsize=10)
-        self.ax.grid(True, alpha=0.2, color='white')
-        
-    def plot_bitrate(self, times, bitrates, windowed_times, windowed_bitrates):
-        print(f"DEBUG: Plotting {len(times)} frames, {len(windowed_times)} windowed points")
-        
-        self.ax.clear()
-        self.setup_plot()
-        
-        if len(times) > 0 and len(bitrates) > 0:
-            self.ax.plot(times, bitrates, alpha=0.3, color='#4fc3f7', 
-                        linewidth=0.5, label='Per-frame')
-            print(f"DEBUG: Plotted per-frame: {len(times)} points")
-        
-        if len(windowed_times) > 0 and len(windowed_bitrates) > 0:
-            self.ax.plot(windowed_times, windowed_bitrates, color='#00e676', 
-                        linewidth=2, label='1s average')
-            self.ax.fill_between(windowed_times, windowed_bitrates, 
-                                alpha=0.3, color='#00e676')
-            print(f"DEBUG: Plotted windowed: {len(windowed_times)} points")
-        
-        self.ax.legend(facecolor='#2b2b2b', edgecolor='white', 
-                      labelcolor='white', loc='upper right')
-        self.ax.set_title('Bitrate Over Time', color='white', 
-                         fontsize=12, fontweight='bold', pad=10)
-        
-        self.fig.tight_layout()
-        self.draw()
-        self.flush_events()
-        print("DEBUG: Chart draw() called")
+def analyse_video(filepath, ffprobe_path='ffprobe', summary_only=False):
+    """
+    Probe a file and calculate its statistics in one call.
+    Module-level so it can be sent to a worker process for batch analysis.
+    With summary_only, the per-frame data and series are left out and only
+    the metadata and scalar statistics are returned; the full result can
+    be rebuilt from the probe cache later.
+    """
+    cached = load_cached_probe(filepath)
+    if cached is None:
+        cached = VideoAnalyzer._probe(filepath, ffprobe_path)
+        save_cached_probe(filepath, *cached)
+    metadata, frame_data = cached
+    stats = VideoAnalyzer._calculate_statistics(frame_data, metadata)
+    if summary_only:
+        stats = {name: value for name, value in stats.items()
+                 if not isinstance(value, np.ndarray)}
+        return {'metadata': metadata, 'stats': stats}
+    return {'metadata': metadata, 'frame_data': frame_data, 'stats': stats}
+
+
+class BatchAnalyzer(QThread):
+    """
+    Analyse every video in a folder across a pool of worker processes.
+    NEW in v1.3.0: Folder analysis, one ffprobe per worker at a time.
+    Workers send back summaries only, so memory does not grow with the
+    folder; the first successful file, the one that gets plotted, is
+    re-loaded in full from the probe cache at the end.
+    """
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(list)
+    error = pyqtSignal(str)
+    
+    def __init__(self, filepaths, max_workers, ffprobe_path):
+        super().__init__()
+        self.filepaths = filepaths
+        self.max_workers = max_workers
+        self.ffprobe_path = ffprobe_path
+    
+    def run(self):
+        try:
+            if self.ffprobe_path is None:
+                self.error.emit("FFprobe not found. Install with: brew install ffmpeg")
+                return
+            
+            total = len(self.filepaths)
+            self.progress.emit(0, f"Analyzing {total} files...")
+            batch = []
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {pool.submit(analyse_video, path, self.ffprobe_path, True): path
+                           for path in self.filepaths}
+                for done, future in enumerate(as_completed(futures), 1):
+                    path = futures[future]
+                    try:
+                        batch.append((path, future.result(), None))
+                    except Exception as e:
+                        batch.append((path, None, str(e)))
+                    self.progress.emit(int(100 * done / total),
+                                       f"Analyzed {Path(path).name} ({done}/{total})")
+            
+            # Report in folder order rather than completion order
+            order = {path: i for i, path in enumerate(self.filepaths)}
+            batch.sort(key=lambda item: order[item[0]])
+            
+            for i, (path, results, error) in enumerate(batch):
+                if error is None and results['stats']:
+                    try:
+                        batch[i] = (path, analyse_video(path, self.ffprobe_path), None)
+                        break
+                    except Exception as e:
+                        # e.g. the cache write failed and the file has since
+                        # changed or gone; show the next file instead
+                        batch[i] = (path, None, str(e))
+            self.finished.emit(batch)
+            
+        except Exception as e:
+            self.error.emit(f"Batch analysis error: {str(e)}")
+
+
+def write_json_export(f, export_data, times, bitrates):
+    """
+    Write export_data as JSON with a 'timeline' of the bitrate series added.
+    NEW in v1.3.0: The timeline is two parallel arrays ('times' and
+    'bitrates_mbps') rather than one object per point, serialised straight
+    from the NumPy arrays by orjson when it is installed.
+    """
+    header = json.dumps(export_data, indent=2)
+    f.write(header[:header.rindex('}')].rstrip())
+    f.write(',\n  "timeline": {\n    "times": ')
+    f.write(_json_array(times))
+    f.write(',\n    "bitrates_mbps": ')
+    f.write(_json_array(bitrates))
+    f.write('\n  }\n}\n')
+
+
+def _json_array(values):
+    """Compact JSON text for a 1-D numeric array."""
+    if orjson is not None:
+        return orjson.dumps(np.ascontiguousarray(values),
+                            option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    values = np.asarray(values)
+    if values.dtype == np.float32:
+        # Round-trip through text so each value is the shortest float32
+        # repr, as orjson writes it, not its float64 expansion
+        values = values.astype(str).astype(np.float64)
+    return json.dumps(values.tolist(), separators=(',', ':'))
 
 
 class MainWindow(QMainWindow):
@@ -266,12 +756,36 @@ class MainWindow(QMainWindow):
         
         # Settings for persistent storage
         self.settings = QSettings("ProResAnalyzer", "ProResAnalyzer")
+        # Read once; dialogs use this and _remember_dir keeps it in sync
+        self._last_dir = self.settings.value("last_directory", str(Path.home()))
         
         self.set_dark_theme()
         self.init_ui()
         self.setup_shortcuts()
+        self._detect_ffprobe()
         self.current_file = None
         self.results = None
+    
+    def _detect_ffprobe(self):
+        """
+        Locate ffprobe once at startup rather than on every analysis.
+        The absolute path is handed to the analysis threads, so each spawn
+        skips the PATH lookup too.
+        """
+        self._ffprobe_path = find_ffprobe()
+        logger.debug("ffprobe: %s", self._ffprobe_path)
+    
+    def warn_if_ffprobe_missing(self):
+        """Tell the user up front, rather than on every analysis, that ffprobe is missing."""
+        if self._ffprobe_path is None:
+            QMessageBox.warning(self, "FFprobe not found",
+                                "FFprobe is needed to analyse video files.\n\n"
+                                "Install it with: brew install ffmpeg")
+    
+    def _remember_dir(self, directory):
+        """Store the directory the next file dialog should open in."""
+        self._last_dir = str(directory)
+        self.settings.setValue("last_directory", self._last_dir)
         
     def set_dark_theme(self):
         palette = QPalette()
@@ -303,6 +817,11 @@ class MainWindow(QMainWindow):
         self.select_btn.clicked.connect(self.select_file)
         self.select_btn.setStyleSheet("padding: 10px; background: #00e676; color: black; font-weight: bold;")
         file_layout.addWidget(self.select_btn)
+        
+        self.select_folder_btn = QPushButton("Select Folder")
+        self.select_folder_btn.clicked.connect(self.select_folder)
+        self.select_folder_btn.setStyleSheet("padding: 10px;")
+        file_layout.addWidget(self.select_folder_btn)
         layout.addLayout(file_layout)
         
         self.progress_bar = QProgressBar()
@@ -316,7 +835,10 @@ class MainWindow(QMainWindow):
         splitter = QSplitter(Qt.Orientation.Horizontal)
         chart_group = QGroupBox("Bitrate Graph")
         chart_layout = QVBoxLayout()
-        self.chart = BitrateChart()
+        # pyqtgraph is imported here, once the splash is up, rather than
+        # at module level, where batch worker processes would pay for it too
+        from bitrate_chart import BitrateChart
+        self.chart = BitrateChart(window_seconds=ROLLING_WINDOW_SECONDS)
         chart_layout.addWidget(self.chart)
         chart_group.setLayout(chart_layout)
         splitter.addWidget(chart_group)
@@ -390,28 +912,62 @@ class MainWindow(QMainWindow):
         Open file dialog and start analysis.
         NEW in v1.2.0: Remembers last used directory.
         """
-        # Get last used directory from settings
-        last_dir = self.settings.value("last_directory", str(Path.home()))
-        
         filepath, _ = QFileDialog.getOpenFileName(
-            self, "Select ProRes Video File", last_dir,
+            self, "Select ProRes Video File", self._last_dir,
             "Video Files (*.mov *.mp4 *.mxf);;All Files (*.*)")
         
         if filepath:
             # Save directory for next time
-            self.settings.setValue("last_directory", str(Path(filepath).parent))
+            self._remember_dir(Path(filepath).parent)
             
             self.current_file = filepath
             self.file_label.setText(Path(filepath).name)
             self.analyze_file(filepath)
     
+    def select_folder(self):
+        """
+        Pick a folder and analyse every video file in it.
+        NEW in v1.3.0: Batch analysis across worker processes.
+        """
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder of Videos",
+                                                  self._last_dir)
+        
+        if folder:
+            self._remember_dir(folder)
+            # Hidden entries include the ._clip.mov AppleDouble files macOS
+            # leaves next to every clip on exFAT and network drives
+            filepaths = sorted(str(p) for p in Path(folder).iterdir()
+                               if p.suffix.lower() in VIDEO_EXTENSIONS
+                               and p.is_file() and not p.name.startswith('.'))
+            if not filepaths:
+                self.show_error(f"No video files found in {Path(folder).name}")
+                return
+            
+            self.file_label.setText(f"{Path(folder).name} ({len(filepaths)} files)")
+            self.analyze_folder(filepaths)
+    
+    def analyze_folder(self, filepaths):
+        # Workers each run their own ffprobe; lower this on disk-bound storage
+        max_workers = self.settings.value("batch_workers", os.cpu_count() or 1, type=int)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.info_text.clear()
+        self.export_btn.setEnabled(False)
+        self.export_graph_btn.setEnabled(False)
+        self.batch_analyser = BatchAnalyzer(filepaths, max(max_workers, 1),
+                                            self._ffprobe_path)
+        self.batch_analyser.progress.connect(self.update_progress)
+        self.batch_analyser.finished.connect(self.display_batch_results)
+        self.batch_analyser.error.connect(self.show_error)
+        self.batch_analyser.start()
+    
     def analyze_file(self, filepath):
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.info_text.clear()
         self.export_btn.setEnabled(False)
         self.export_graph_btn.setEnabled(False)
-        self.analyser = VideoAnalyzer(filepath)
+        self.analyser = VideoAnalyzer(filepath, self._ffprobe_path)
         self.analyser.progress.connect(self.update_progress)
         self.analyser.finished.connect(self.display_results)
         self.analyser.error.connect(self.show_error)
@@ -421,29 +977,33 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(value)
         self.status_label.setText(message)
     
+    def set_status(self, message, style):
+        """Show a status message; the stylesheet is only re-applied when it changes."""
+        self.status_label.setText(message)
+        if self.status_label.styleSheet() != style:
+            self.status_label.setStyleSheet(style)
+    
     def show_error(self, message):
         self.progress_bar.setVisible(False)
-        self.status_label.setText(f"Error: {message}")
-        self.status_label.setStyleSheet("color: #ff5252;")
+        self.set_status(f"Error: {message}", STATUS_ERROR_STYLE)
     
     def display_results(self, results):
         self.results = results
         self.progress_bar.setVisible(False)
-        self.status_label.setText("Analysis complete")
-        self.status_label.setStyleSheet("color: #00e676;")
+        self.set_status("Analysis complete", STATUS_OK_STYLE)
         self.export_btn.setEnabled(True)
         self.export_graph_btn.setEnabled(True)
         
         metadata = results['metadata']
         stats = results['stats']
         
-        print(f"DEBUG: Times length: {len(stats['times'])}")
-        print(f"DEBUG: Bitrates length: {len(stats['bitrates'])}")
-        print(f"DEBUG: Windowed times length: {len(stats['windowed_times'])}")
-        print(f"DEBUG: Windowed bitrates length: {len(stats['windowed_bitrates'])}")
-        if len(stats['bitrates']) > 0:
-            print(f"DEBUG: Bitrate range: {min(stats['bitrates']):.2f} - "
-                  f"{max(stats['bitrates']):.2f} Mbps")
+        logger.debug("Times/bitrates length: %d/%d, windowed: %d/%d",
+                     len(stats['times']), len(stats['bitrates']),
+                     len(stats['windowed_times']), len(stats['windowed_bitrates']))
+        # min/max are full passes over the data, so only pay for them when logged
+        if logger.isEnabledFor(logging.DEBUG) and len(stats['bitrates']) > 0:
+            logger.debug("Bitrate range: %.2f - %.2f Mbps",
+                         stats['bitrates'].min(), stats['bitrates'].max())
         
         self.chart.plot_bitrate(
             stats['times'],
@@ -474,23 +1034,48 @@ I-Frame Interval: {stats['frame_count'] / max(stats['i_frame_count'], 1):.1f} fr
         
         self.info_text.setPlainText(info)
     
+    def display_batch_results(self, batch):
+        """Summarise a folder analysis and show the first successful file."""
+        lines = ["BATCH SUMMARY",
+                 f"{'File':<40} {'Avg':>8} {'Peak':>8} {'Min':>8}  (Mbps)"]
+        for path, results, error in batch:
+            name = Path(path).name
+            if error is not None:
+                lines.append(f"{name:<40} failed: {error}")
+            elif not results['stats']:
+                lines.append(f"{name:<40} no frames")
+            else:
+                stats = results['stats']
+                lines.append(f"{name:<40} {stats['avg_bitrate']:>8.2f} "
+                             f"{stats['max_bitrate']:>8.2f} {stats['min_bitrate']:>8.2f}")
+        summary = "\n".join(lines)
+        
+        shown = next(((path, results) for path, results, error in batch
+                      if error is None and results['stats']), None)
+        if shown is None:
+            self.show_error("No files could be analyzed")
+            self.info_text.setPlainText(summary)
+            return
+        
+        self.current_file, results = shown
+        self.display_results(results)
+        self.info_text.setPlainText(f"{summary}\n\n{self.info_text.toPlainText()}")
+    
     def export_data(self):
         """Export analysis results as JSON file."""
         if not self.results:
             return
         
-        # Get last used directory
-        last_dir = self.settings.value("last_directory", str(Path.home()))
         default_name = f"bitrate_analysis_{Path(self.current_file).stem}.json"
         
         filepath, _ = QFileDialog.getSaveFileName(
             self, "Export Analysis Data", 
-            str(Path(last_dir) / default_name),
+            str(Path(self._last_dir) / default_name),
             "JSON Files (*.json)")
         
         if filepath:
             # Save directory for next time
-            self.settings.setValue("last_directory", str(Path(filepath).parent))
+            self._remember_dir(Path(filepath).parent)
             
             export_data = {
                 'source_file': self.current_file,
@@ -502,15 +1087,12 @@ I-Frame Interval: {stats['frame_count'] / max(stats['i_frame_count'], 1):.1f} fr
                     'std_bitrate_mbps': self.results['stats']['std_bitrate'],
                     'frame_count': self.results['stats']['frame_count'],
                     'i_frame_count': self.results['stats']['i_frame_count']
-                },
-                'timeline': [
-                    {'time': t, 'bitrate_mbps': br}
-                    for t, br in zip(self.results['stats']['windowed_times'],
-                                   self.results['stats']['windowed_bitrates'])
-                ]
+                }
             }
             with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2)
+                write_json_export(f, export_data,
+                                  self.results['stats']['windowed_times'],
+                                  self.results['stats']['windowed_bitrates'])
             self.status_label.setText(f"Data exported to {Path(filepath).name}")
     
     def export_graph(self):
@@ -522,40 +1104,35 @@ I-Frame Interval: {stats['frame_count'] / max(stats['i_frame_count'], 1):.1f} fr
         if not self.results:
             return
         
-        # Get last used directory
-        last_dir = self.settings.value("last_directory", str(Path.home()))
         default_name = f"bitrate_graph_{Path(self.current_file).stem}.png"
         
         filepath, _ = QFileDialog.getSaveFileName(
             self,
             "Export Graph as Image",
-            str(Path(last_dir) / default_name),
+            str(Path(self._last_dir) / default_name),
             "PNG Image (*.png);;PDF Document (*.pdf);;SVG Vector (*.svg)"
         )
         
         if filepath:
             # Save directory for next time
-            self.settings.setValue("last_directory", str(Path(filepath).parent))
+            self._remember_dir(Path(filepath).parent)
             
             try:
-                self.chart.fig.savefig(
-                    filepath,
-                    dpi=300,
-                    bbox_inches='tight',
-                    facecolor='#2b2b2b'
-                )
-                self.status_label.setText(f"Graph exported to {Path(filepath).name}")
-                self.status_label.setStyleSheet("color: #00e676;")
+                self.chart.export(filepath)
+                self.set_status(f"Graph exported to {Path(filepath).name}", STATUS_OK_STYLE)
             except Exception as e:
-                self.status_label.setText(f"Export failed: {str(e)}")
-                self.status_label.setStyleSheet("color: #ff5252;")
+                self.set_status(f"Export failed: {str(e)}", STATUS_ERROR_STYLE)
 
 
 def main():
-    print(f"DEBUG: Matplotlib backend: {matplotlib.get_backend()}")
-    print(f"DEBUG: Matplotlib version: {matplotlib.__version__}")
-    print("DEBUG: ProRes Bitrate Analyzer v1.2.0")
-    print("DEBUG: New features: Splash screen, keyboard shortcuts, remember directory")
+    # Required for the batch worker processes in a frozen app bundle
+    multiprocessing.freeze_support()
+    
+    # PRORES_DEBUG=1 turns on the debug log; unset, empty or 0 leaves it off
+    debug = os.environ.get('PRORES_DEBUG', '') not in ('', '0')
+    logging.basicConfig(format='%(levelname)s: %(message)s',
+                        level=logging.DEBUG if debug else logging.WARNING)
+    logger.debug("ProRes Bitrate Analyzer v1.2.0")
     
     app = QApplication(sys.argv)
     app.setApplicationName("ProRes Bitrate Analyzer")
@@ -567,10 +1144,13 @@ def main():
     
     # Create main window (this is the slow part)
     window = MainWindow()
+    import pyqtgraph  # already loaded by the chart
+    logger.debug("pyqtgraph version: %s", pyqtgraph.__version__)
     
     # Close splash and show main window
     splash.finish(window)
     window.show()
+    window.warn_if_ffprobe_missing()
     
     sys.exit(app.exec())
 
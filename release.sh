@@ -105,12 +105,21 @@ pkill -f "$APP_NAME" || true
 # 3. Force remove with a 'nuclear' option
 # We use -rf. If it fails, we wait 1 second and try once more.
 rm -rf build dist || (sleep 1 && rm -rf build dist)
+rm -f _prores_kernels*.so
 
 # 4. Final sweep for spec files
 rm -f *.spec
 
 print_success "Build directories cleaned"
 
+# Step 5.5: Compile the Numba statistics kernel ahead of time
+print_step "Compiling statistics kernel..."
+if python build_kernels.py > kernels.log 2>&1; then
+    print_success "Kernel compiled (_prores_kernels)"
+else
+    print_warning "Kernel build failed, app will JIT-compile on first use (see kernels.log)"
+fi
+
 # Step 6: Build the application
 print_step "Building application with PyInstaller..."
 # Using --noconfirm ensures it doesn't stop to ask if it can overwrite files
@@ -119,6 +128,10 @@ pyinstaller --noconfirm --windowed \
   --osx-bundle-identifier "com.local.proresanalyser" \
   --hidden-import "PyQt6" \
   --collect-all "PyQt6" \
+  --exclude-module "matplotlib" \
+  --exclude-module "tkinter" \
+  --exclude-module "PIL" \
+  --exclude-module "IPython" \
   --clean \
   prores_analyser.py > build.log 2>&1
 
@@ -129,6 +142,10 @@ pyinstaller --noconfirm --windowed \
   --osx-bundle-identifier "com.local.proresanalyser" \
   --hidden-import "PyQt6" \
   --collect-all "PyQt6" \
+  --exclude-module "matplotlib" \
+  --exclude-module "tkinter" \
+  --exclude-module "PIL" \
+  --exclude-module "IPython" \
   --add-binary "/opt/homebrew/bin/ffprobe:." \
   --clean \
   prores_analyser.py > build.log 2>&1